@@ -1,4 +1,4 @@
-document.addEventListener('DOMContentLoaded', () => {
+(() => {
     if (!window.reportData) {
         console.error("未找到报告数据");
         return;
@@ -6,20 +6,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
     const { chartConfig, allData, hasBenchmark } = window.reportData;
 
-    // 图表高度自适应
-    const chartContainer = document.getElementById('chart-container');
-    const setChartHeight = () => {
-        const width = chartContainer.offsetWidth;
-        chartContainer.style.height = Math.max(Math.min(width * 0.6, 700), 400) + 'px';
-    };
-    setChartHeight();
-    window.addEventListener('resize', () => {
-        setChartHeight();
-        myChart.resize();
-    });
-
-    const myChart = echarts.init(chartContainer);
-    myChart.setOption(chartConfig);
+    // 本脚本位于 body 末尾，DOM 已就绪：先填充卡片和指标，不等待 echarts 加载
 
     // 控制 benchmark 相关元素显示
     if (!hasBenchmark) {
@@ -111,4 +98,34 @@ document.addEventListener('DOMContentLoaded', () => {
 
     populateSummaryCards();
     updateIndicators('interval');
-});
+
+    // 图表：echarts 以 defer 方式加载，DOMContentLoaded 时才可用
+    const initChart = () => {
+        if (typeof echarts === 'undefined') {
+            console.error("echarts 加载失败，图表未渲染");
+            return;
+        }
+
+        // 图表高度自适应
+        const chartContainer = document.getElementById('chart-container');
+        const setChartHeight = () => {
+            const width = chartContainer.offsetWidth;
+            chartContainer.style.height = Math.max(Math.min(width * 0.6, 700), 400) + 'px';
+        };
+        setChartHeight();
+
+        const myChart = echarts.init(chartContainer);
+        myChart.setOption(chartConfig);
+
+        window.addEventListener('resize', () => {
+            setChartHeight();
+            myChart.resize();
+        });
+    };
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', initChart);
+    } else {
+        initChart();
+    }
+})();
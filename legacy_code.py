@@ -5,8 +5,10 @@ Legacy Code - 数据准备和指标计算逻辑
 母项目应负责数据获取、清洗和指标计算，然后调用 Nav_Show 的 render_report() 生成 HTML。
 """
 
+import copy
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from numpy.typing import NDArray
 from typing import Optional, Dict
 
@@ -17,6 +19,24 @@ from typing import Optional, Dict
 # import pandas as pd
 
 
+def _drawdown(values: NDArray[np.floating]) -> NDArray[np.floating]:
+    """相对历史最高点的回撤，沿最后一维计算；传入 (K, N) 数组可一次处理 K 条序列"""
+    cummax = np.maximum.accumulate(values, axis=-1)
+    return (values - cummax) / cummax
+
+
+def _to_pct_list(
+    values: NDArray[np.floating],
+    offset: float = 0.0,
+    out: Optional[NDArray[np.float64]] = None,
+) -> list:
+    """(values - offset) * 100 并保留两位小数，在同一缓冲区内原地完成；可传入复用的 out"""
+    out = np.subtract(values, offset, out=out, dtype=np.float64)
+    out *= 100
+    np.round(out, 2, out=out)
+    return out.tolist()
+
+
 def prepare_data(
     date: NDArray[np.datetime64],
     nav: NDArray[np.floating],
@@ -36,34 +56,45 @@ def prepare_data(
     assert len(date) == len(nav), "日期与净值数据长度不匹配"
 
     nav_norm = nav / nav[0]  # 归一化
-    df = (
-        pd.DataFrame({"date": pd.to_datetime(date), "nav": nav_norm})
-        .set_index("date")
-        .sort_index()
-    )
-
-    # 计算策略回撤
-    cummax = np.maximum.accumulate(nav_norm)
-    df["drawdown"] = (nav_norm - cummax) / cummax
 
-    if benchmark is not None:
+    if benchmark is None:
+        # 计算策略回撤
+        columns = {"nav": nav_norm, "drawdown": _drawdown(nav_norm)}
+    else:
         assert len(date) == len(benchmark), "日期与基准数据长度不匹配"
 
         # 归一化基准
-        df["benchmark"] = benchmark / benchmark[0]
+        bench_norm = benchmark / benchmark[0]
 
         # 计算超额净值（几何超额）
-        df["excess_nav"] = nav_norm / df["benchmark"].values
+        excess_nav = nav_norm / bench_norm
 
-        # 计算基准回撤
-        cummax_bench = np.maximum.accumulate(np.asarray(df["benchmark"].values))
-        df["drawdown_benchmark"] = (df["benchmark"] - cummax_bench) / cummax_bench
+        # 策略、基准、超额三条序列堆叠为 (3, N)，一次计算全部回撤
+        dd_nav, dd_bench, dd_excess = _drawdown(
+            np.vstack([nav_norm, bench_norm, excess_nav])
+        )
+        columns = {
+            "nav": nav_norm,
+            "drawdown": dd_nav,
+            "benchmark": bench_norm,
+            "excess_nav": excess_nav,
+            "drawdown_benchmark": dd_bench,
+            "drawdown_excess": dd_excess,
+        }
 
-        # 计算超额回撤
-        cummax_excess = np.maximum.accumulate(np.asarray(df["excess_nav"].values))
-        df["drawdown_excess"] = (df["excess_nav"] - cummax_excess) / cummax_excess
+    # 先在 NumPy 中算完，再一次性构造 DataFrame，避免逐列赋值
+    index = pd.DatetimeIndex(pd.to_datetime(date), name="date")
+    return pd.DataFrame(columns, index=index).sort_index()
 
-    return df
+
+@lru_cache(maxsize=32)
+def _generate_intervals(last_day: np.datetime64, last_week_day: np.datetime64):
+    """按 (last_day, last_week_day) 缓存周期定义，批量生成同一截止日的报告时只算一次"""
+    from nav_interval_metric.nav_metric import NavMetric
+
+    return tuple(
+        NavMetric.generate_intervals(last_day=last_day, last_week_day=last_week_day)
+    )
 
 
 def calculate_indicators(
@@ -99,9 +130,8 @@ def calculate_indicators(
     all_data = {}
 
     # 生成周期定义
-    base_interval = NavMetric.generate_intervals(
-        last_day=last_date, last_week_day=last_week_date
-    )
+    # 深拷贝缓存结果：NavMetric 可能原地修改周期对象，不能在报告之间共享
+    base_interval = copy.deepcopy(list(_generate_intervals(last_date, last_week_date)))
 
     # 辅助函数：提取指标数据
     def _extract_metrics(metric: NavMetric, intervals: list, suffix: str = ""):
@@ -119,10 +149,21 @@ def calculate_indicators(
         }
         # 标准周期指标
         calculated_intervals = metric.calculate_interval_return(intervals)
-        for _interval in calculated_intervals:
+        # 起止日期批量转为字符串，避免循环内逐个调用 datetime_as_string
+        start_dates = np.datetime_as_string(
+            np.array([iv.start_date for iv in calculated_intervals], "datetime64[D]"),
+            unit="D",
+        ).tolist()
+        end_dates = np.datetime_as_string(
+            np.array([iv.end_date for iv in calculated_intervals], "datetime64[D]"),
+            unit="D",
+        ).tolist()
+        for _interval, start_date, end_date in zip(
+            calculated_intervals, start_dates, end_dates
+        ):
             data[_interval.name + suffix] = {
-                "start_date": np.datetime_as_string(_interval.start_date, unit="D"),
-                "end_date": np.datetime_as_string(_interval.end_date, unit="D"),
+                "start_date": start_date,
+                "end_date": end_date,
                 "interval_return": _interval.interval_return,
                 "interval_anual_return": _interval.interval_annual_return,
                 "interval_annual_vol": _interval.interval_annual_vol,
@@ -169,14 +210,16 @@ def prepare_chart_data_for_nav_show(df: pd.DataFrame, has_benchmark: bool) -> di
     Returns:
         符合 ChartData TypedDict 的字典
     """
-    dates = df.index.strftime("%Y-%m-%d").tolist()
-    nav_pct = ((df["nav"].values - 1) * 100).round(2).tolist()
-    drawdown = (df["drawdown"].values * 100).round(2).tolist()
+    dates = np.datetime_as_string(df.index.values, unit="D").tolist()
+    # 各序列共用一块缓冲区：tolist() 已把结果拷出，可直接覆写
+    buf = np.empty(len(df), dtype=np.float64)
+    nav_pct = _to_pct_list(df["nav"].to_numpy(), offset=1.0, out=buf)
+    drawdown = _to_pct_list(df["drawdown"].to_numpy(), out=buf)
 
     if has_benchmark:
-        bench_pct = ((df["benchmark"].values - 1) * 100).round(2).tolist()
-        excess_pct = ((df["excess_nav"].values - 1) * 100).round(2).tolist()
-        drawdown_excess = (df["drawdown_excess"].values * 100).round(2).tolist()
+        bench_pct = _to_pct_list(df["benchmark"].to_numpy(), offset=1.0, out=buf)
+        excess_pct = _to_pct_list(df["excess_nav"].to_numpy(), offset=1.0, out=buf)
+        drawdown_excess = _to_pct_list(df["drawdown_excess"].to_numpy(), out=buf)
     else:
         bench_pct = []
         excess_pct = []
@@ -215,7 +258,9 @@ if __name__ == "__main__":
     )
     nav_series = pd.Series(nav_raw, index=pd.to_datetime(dates_raw))
     nav_series = nav_series.reindex(weekly_dates).dropna()
-    nav_series = nav_series[nav_series.index >= pd.to_datetime(begin_date)]
+    # 索引已有序：二分查找起点后按位置切片，避免整列布尔掩码
+    start_pos = nav_series.index.searchsorted(pd.Timestamp(begin_date))
+    nav_series = nav_series.iloc[start_pos:]
 
     date = nav_series.index.values
     nav = nav_series.values
@@ -1,9 +1,14 @@
 import json
 import shutil
 from pathlib import Path
-from typing import Optional, TypedDict
-from pyecharts import options as opts
-from pyecharts.charts import Line, Grid
+from typing import TypedDict
+
+import simplejson
+
+try:
+    import orjson
+except ImportError:  # 可选依赖，未安装时回退到 simplejson（pyecharts 的依赖）
+    orjson = None
 
 
 class ChartData(TypedDict):
@@ -15,7 +20,29 @@ class ChartData(TypedDict):
     drawdown_excess: list  # 可选，无基准时传空列表
 
 
-def _generate_chart_config(chart_data: ChartData, has_benchmark: bool) -> dict:
+def _dumps(obj, default=None) -> str:
+    # 紧凑分隔符 + 保留中文原文，减小内嵌到 HTML 中的数据体积
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=default, option=orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    # ignore_nan：NaN 输出为 null，与 orjson 一致，前端显示为 "--"
+    return simplejson.dumps(
+        obj,
+        default=default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        ignore_nan=True,
+    )
+
+
+def _generate_chart_config(chart_data: ChartData, has_benchmark: bool) -> str:
+    # 延迟导入：pyecharts 依赖较重，仅在真正生成图表时加载
+    from pyecharts import options as opts
+    from pyecharts.charts import Line, Grid
+    from pyecharts.charts.base import default as pyecharts_default
+    from pyecharts.commons.utils import replace_placeholder_with_quotes
+
     date_list = chart_data["dates"]
 
     line = (
@@ -26,6 +53,7 @@ def _generate_chart_config(chart_data: ChartData, has_benchmark: bool) -> dict:
             chart_data["nav"],
             is_smooth=False,
             is_symbol_show=False,
+            sampling="lttb",
             linestyle_opts=opts.LineStyleOpts(width=2, color="#d9534f"),
         )
     )
@@ -36,12 +64,14 @@ def _generate_chart_config(chart_data: ChartData, has_benchmark: bool) -> dict:
             chart_data["benchmark"],
             is_smooth=False,
             is_symbol_show=False,
+            sampling="lttb",
             linestyle_opts=opts.LineStyleOpts(width=2, color="#5cb85c"),
         ).add_yaxis(
             "超额收益",
             chart_data["excess_nav"],
             is_smooth=False,
             is_symbol_show=False,
+            sampling="lttb",
             linestyle_opts=opts.LineStyleOpts(width=1, color="#007bff"),
             areastyle_opts=opts.AreaStyleOpts(opacity=0.2, color="#007bff"),
         )
@@ -94,6 +124,7 @@ def _generate_chart_config(chart_data: ChartData, has_benchmark: bool) -> dict:
             chart_data["drawdown"],
             is_smooth=False,
             is_symbol_show=False,
+            sampling="lttb",
             linestyle_opts=opts.LineStyleOpts(width=1, color="#d9534f"),
             areastyle_opts=opts.AreaStyleOpts(opacity=0.5, color="#d9534f"),
         )
@@ -105,6 +136,7 @@ def _generate_chart_config(chart_data: ChartData, has_benchmark: bool) -> dict:
             chart_data["drawdown_excess"],
             is_smooth=False,
             is_symbol_show=False,
+            sampling="lttb",
             linestyle_opts=opts.LineStyleOpts(width=1, color="#5cb85c"),
             areastyle_opts=opts.AreaStyleOpts(opacity=0.5, color="#5cb85c"),
         )
@@ -121,7 +153,11 @@ def _generate_chart_config(chart_data: ChartData, has_benchmark: bool) -> dict:
     grid.add(line, grid_opts=opts.GridOpts(pos_top="12%", pos_bottom="38%"))
     grid.add(dd_chart, grid_opts=opts.GridOpts(pos_top="70%", pos_bottom="10%"))
 
-    return json.loads(grid.dump_options_with_quotes())
+    # 与 dump_options_with_quotes 相同的处理（Opts 对象 default、NaN -> null、
+    # JsCode 去引号），但只紧凑序列化一次，省去 json.loads -> json.dumps 的往返
+    return replace_placeholder_with_quotes(
+        _dumps(grid.get_options(), default=pyecharts_default)
+    )
 
 
 def render_report(
@@ -140,23 +176,26 @@ def render_report(
     with open(template_path, "r", encoding="utf-8") as f:
         html_content = f.read()
 
-    html_content = html_content.replace(
-        "<h1>区间基础指标</h1>", f"<h1>{name} 业绩报告</h1>"
+    # 在注入点切开模板，分段写出，避免再拼接一份完整 HTML 副本；
+    # 标题只在头部替换一次，两次扫描都在首个命中处停止
+    if "<!-- DATA_INJECTION -->" not in html_content:
+        raise ValueError(
+            f"模板缺少数据注入标记 <!-- DATA_INJECTION -->: {template_path}"
+        )
+    html_head, html_tail = html_content.split("<!-- DATA_INJECTION -->", 1)
+    html_head = html_head.replace(
+        "<h1>区间基础指标</h1>", f"<h1>{name} 业绩报告</h1>", 1
     )
 
     js_data = f"""
     window.reportData = {{
         version: "1.0",
-        chartConfig: {json.dumps(_generate_chart_config(chart_data, has_benchmark))},
-        allData: {json.dumps(metrics)},
+        chartConfig: {_generate_chart_config(chart_data, has_benchmark)},
+        allData: {_dumps(metrics)},
         hasBenchmark: {str(has_benchmark).lower()}
     }};
     """
 
-    html_content = html_content.replace(
-        "<!-- DATA_INJECTION -->", f"<script>{js_data}</script>"
-    )
-
     output_path = Path(output_html)
     output_dir = output_path.parent if output_path.parent != Path("") else Path(".")
     src_assets = base_dir / "assets"
@@ -165,7 +204,7 @@ def render_report(
         shutil.copytree(src_assets, dest_assets, dirs_exist_ok=True)
 
     with open(output_html, "w", encoding="utf-8") as f:
-        f.write(html_content)
+        f.writelines((html_head, f"<script>{js_data}</script>", html_tail))
 
     print(f"业绩报告已生成: {output_html}")
 